@@ -1 +1 @@
-from .tensor import Tensor
\ No newline at end of file
+from .tensor import Tensor, no_grad
\ No newline at end of file
@@ -11,6 +11,7 @@ def isscalar(array: NDArray) -> bool:
 
 # ***** math functions (binary) *****
 class Add(Context):
+    __slots__ = ()
     def __init__(self, *tensors):
         super().__init__(tensors)
 
@@ -30,6 +31,7 @@ class Add(Context):
         return '+'
 
 class Sub(Context):
+    __slots__ = ()
     def __init__(self, *tensors):
         super().__init__(tensors)
 
@@ -49,6 +51,7 @@ class Sub(Context):
         return '-'
 
 class Mul(Context):
+    __slots__ = ()
     def __init__(self, *tensors):
         super().__init__(tensors)
 
@@ -70,6 +73,7 @@ class Mul(Context):
         return '*'
 
 class Div(Context):
+    __slots__ = ()
     def __init__(self, *tensors):
         super().__init__(tensors)
 
@@ -90,6 +94,7 @@ class Div(Context):
         return '/'
 
 class Matmul(Context):
+    __slots__ = ()
     def __init__(self, *tensors):
         super().__init__(tensors)
 
@@ -111,6 +116,7 @@ class Matmul(Context):
 
 # ***** math functions (unary) *****
 class Pow(Context):
+    __slots__ = ()
     def __init__(self, *tensors):
         super().__init__(tensors)
 
@@ -127,6 +133,7 @@ class Pow(Context):
         return '**'
 
 class Exp(Context):
+    __slots__ = ()
     def __init__(self, *tensors):
         super().__init__(tensors)
 
@@ -143,6 +150,7 @@ class Exp(Context):
         return 'exp'
 
 class Log(Context):
+    __slots__ = ()
     def __init__(self, *tensors):
         super().__init__(tensors)
 
@@ -159,6 +167,7 @@ class Log(Context):
         return 'ln'
 
 class Reciprocal(Context):
+    __slots__ = ()
     def __init__(self, *tensors):
         super().__init__(tensors)
 
@@ -175,6 +184,7 @@ class Reciprocal(Context):
         return 'reciprocal'
 
 class Abs(Context):
+    __slots__ = ()
     def _init_(self, *tensors):
         super()._init_(tensors)
 
@@ -8,6 +8,7 @@ from giagrad.tensor import Context
 
 # ***** activation functions *****
 class ReLU(Context):
+	__slots__ = ()
 	def __init__(self, *tensors):
 		super().__init__(tensors)
 
@@ -16,10 +16,11 @@ class Reduction:
     That reshaping process only consists in reducing
     like sum(), see Torch.backward() and tests/operationstTests.ipynb
     """
-    ...
+    __slots__ = ()
 
 # **** reduction functions *****
 class Sum(Context, Reduction):
+    __slots__ = ()
     def __init__(self, *tensors):
         super(Sum, self).__init__(tensors)
 
@@ -37,6 +38,7 @@ class Sum(Context, Reduction):
         return 'sum'           
 
 class Max(Context, Reduction):
+    __slots__ = ()
     def __init__(self, *tensors):
         super(Max, self).__init__(tensors)
 
@@ -59,6 +61,7 @@ class Max(Context, Reduction):
 
 
 class Min(Context, Reduction):
+    __slots__ = ()
     def __init__(self, *tensors):
         super().__init__(tensors)
 
@@ -80,6 +83,7 @@ class Min(Context, Reduction):
         return 'min'  
 
 class Mean(Context, Reduction):
+    __slots__ = ()
     def __init__(self, *tensors):
         super().__init__(tensors)
 
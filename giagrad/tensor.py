@@ -1,3 +1,340 @@
+# tensor : the heart of giagrad, Tensor and Context
+from __future__ import annotations
+import numpy as np
+from numpy.typing import NDArray
+from typing import Any, Dict, List, Optional, Set, Tuple
+import math
+
+# default_rng() seeds from the OS on every call, which dwarfs the cost of
+# actually sampling small shapes; one generator serves the whole module
+_RNG = np.random.default_rng()
+
+# ***** gradient switch *****
+_GRAD_ENABLED = True
+
+
+class no_grad:
+    """
+    While active, comm drops the recorded context so no graph is built:
+    for inference, and for any tensor math inside backward itself that
+    must not record second-order bookkeeping.
+    """
+    __slots__ = ('prev',)
+
+    def __enter__(self):
+        global _GRAD_ENABLED
+        self.prev = _GRAD_ENABLED
+        _GRAD_ENABLED = False
+
+    def __exit__(self, *exc):
+        global _GRAD_ENABLED
+        _GRAD_ENABLED = self.prev
+
+# ***** buffer pool *****
+# Training loops create and drop the same shapes every iteration; keeping
+# a few spare arrays per shape skips the allocator on the hot path.
+_BUFFER_POOL: Dict[Tuple[int, ...], List[NDArray]] = {}
+_BUCKET_CAP = 8  # spare arrays kept per shape
+
+
+def _rent(shape: Tuple[int, ...], zero: bool = False) -> NDArray:
+    bucket = _BUFFER_POOL.get(tuple(shape))
+    if bucket:
+        buf = bucket.pop()
+        if zero:
+            buf.fill(0)
+        return buf
+    return np.zeros(shape, dtype=np.float32) if zero else np.empty(shape, dtype=np.float32)
+
+
+def _uniform_buf(shape: Tuple[int, ...], scale: float) -> NDArray:
+    # U[-scale, scale) touching the buffer a single extra time per pass:
+    # buf = buf * 2*scale - scale, all in place, no temporaries
+    buf = _RNG.random(size=shape, dtype=np.float32)
+    np.multiply(buf, 2 * scale, out=buf)
+    np.subtract(buf, scale, out=buf)
+    return buf
+
+
+# One contiguous block per backward pass holds every intermediate grad;
+# reused across iterations since training loops build the same graph.
+_GRAD_BLOCKS: Dict[int, NDArray] = {}
+
+
+def _release(array):
+    # only whole owned float32 buffers, never views into someone else's
+    if not (isinstance(array, np.ndarray) and array.dtype == np.float32 and array.base is None):
+        return
+    bucket = _BUFFER_POOL.setdefault(array.shape, [])
+    if len(bucket) < _BUCKET_CAP:
+        bucket.append(array)
+
+
+class Context:
+    """
+    Attaches an operator to the tensor it created.
+
+    Every operator in mathops/reductionops/mlops subclasses Context,
+    saves whatever it needs for the chain rule in parents (operand
+    tensors and sometimes plain ndarrays like masks) and implements
+    forward/backward, see tests/operationsTests.ipynb
+    """
+    __slots__ = ('parents',)
+
+    def __init__(self, tensors: Tuple[Any, ...]):
+        self.parents = tensors
+
+    @classmethod
+    def forward(cls, *tensors) -> Tuple[NDArray, Context]:
+        raise NotImplementedError
+
+    def backward(self, partial: NDArray):
+        raise NotImplementedError
+
+    def __str__(self):
+        return type(self).__name__
+
+
+class Tensor:
+    __slots__ = ('data', 'shape', '_grad', '_ctx', 'requires_grad', 'name', 'leaf')
+
+    dtype = np.float32  # giagrad is float32 only
+    _last_topo_len = 0  # size of the last graph backward walked
+
+    def __init__(self, data, requires_grad: bool = False, context: Optional[Context] = None, name: str = ''):
+        # adopt arrays that are already in our layout (notably every
+        # forward output flowing through comm) instead of copying them
+        if isinstance(data, np.ndarray) and data.dtype == np.float32 and data.flags.c_contiguous:
+            self.data = data
+        else:
+            # order='C' copies only when needed; unlike ascontiguousarray
+            # it keeps 0-d scalars (reduction outputs) 0-d
+            self.data = np.asarray(data, dtype=np.float32, order='C')
+        self.shape = self.data.shape  # data is never reshaped in place
+        self._grad = None  # materialized on first access, inference never pays for it
+        self._ctx = context
+        self.requires_grad = requires_grad
+        self.name = name
+        self.leaf = context is None  # user-made tensors keep data/grad after backward
+
+    @property
+    def grad(self) -> NDArray:
+        if self._grad is None:
+            self._grad = _rent(self.data.shape, zero=True)
+        return self._grad
+
+    @grad.setter
+    def grad(self, value):
+        self._grad = value
+
+    def __repr__(self):
+        return f"Tensor({self.data}, name: {self.name})" if self.name else f"Tensor({self.data})"
+
+    def __str__(self):
+        return self.__repr__()
+
+    # ***** autodiff *****
+    @classmethod
+    def comm(cls, operation, *tensors, **kwargs) -> Tensor:
+        # binary ops are the hot path: skip the listcomp and wrap scalar
+        # operands directly (constants never ask for gradients)
+        if len(tensors) == 2:
+            t1, t2 = tensors
+            # constant folding: identities against 0 and 1 need no graph
+            # node, the operand already is the result (grads included)
+            if type(t1) is Tensor and isinstance(t2, (int, float)):
+                if t2 == 0 and (operation is cls._ADD or operation is cls._SUB):
+                    return t1
+                if t2 == 1 and (operation is cls._MUL or operation is cls._DIV):
+                    return t1
+            elif type(t2) is Tensor and isinstance(t1, (int, float)):
+                if (t1 == 0 and operation is cls._ADD) or (t1 == 1 and operation is cls._MUL):
+                    return t2
+            if type(t1) is not Tensor:
+                t1 = Tensor(t1)
+            if type(t2) is not Tensor:
+                t2 = Tensor(t2)
+            data, context = operation.forward(t1, t2, **kwargs)
+        else:
+            operands = [t if isinstance(t, Tensor) else Tensor(t) for t in tensors]
+            data, context = operation.forward(*operands, **kwargs)
+        if _GRAD_ENABLED:
+            return cls(data, requires_grad=True, context=context)
+        return cls(data)
+
+    def backward(self):
+        # Topological order of the graph, iterative two-colour DFS:
+        # an explicit stack avoids per-node call overhead and CPython's
+        # recursion limit on deep graphs (e.g. unrolled RNNs). First
+        # visit pushes the children, second one appends to topo.
+        topo: List[Tensor] = []
+        visited: Set[int] = set()  # ids avoid __hash__ dispatch
+        stack: List[Tuple[Tensor, bool]] = [(self, False)]
+
+        # this loop is pure interpreter overhead paid once per edge, so
+        # bind the hot lookups to locals and check types exactly
+        stack_pop = stack.pop
+        stack_append = stack.append
+        visited_add = visited.add
+        topo_append = topo.append
+
+        while stack:
+            tensor, processed = stack_pop()
+            if processed:
+                topo_append(tensor)
+                continue
+            tid = id(tensor)
+            if tid in visited:
+                # already expanded through another parent, e.g. x * x
+                continue
+            visited_add(tid)
+            if (context := tensor._ctx):
+                stack_append((tensor, True))
+                for t in context.parents:
+                    if type(t) is Tensor and id(t) not in visited:
+                        stack_append((t, False))
+
+        # remember the graph size: a capacity hint for the next call
+        n = len(topo)
+        Tensor._last_topo_len = n
+
+        # hand every graph node a zeroed float32 slice of one contiguous
+        # block: a single allocation (amortized to none) instead of one
+        # per node, and neighbouring grads stay cache-friendly
+        total = 0
+        offsets = [0] * n  # exact size known, no list regrowth
+        for i, t in enumerate(topo):
+            offsets[i] = total
+            total += t.data.size
+        block = _GRAD_BLOCKS.get(total)
+        if block is None:
+            block = np.empty(total, dtype=np.float32)
+            _GRAD_BLOCKS[total] = block
+        block.fill(0)
+        for t, off in zip(topo, offsets):
+            t._grad = block[off:off + t.data.size].reshape(t.shape)
+
+        # chain rule; gradient math must never record a second graph
+        self.grad.fill(1.0)
+        with no_grad():
+            for tensor in reversed(topo):
+                tensor._ctx.backward(tensor.grad)
+                del tensor._ctx
+                if tensor is not self and not tensor.leaf:
+                    # every consumer of this node already ran its backward, so
+                    # both the activation and the grad are dead weight now
+                    _release(tensor.data)
+                    _release(tensor._grad)
+                    tensor.data = None
+                    tensor._grad = None
+
+    def release(self):
+        """Hand data and grad back to the buffer pool; the tensor must not be used afterwards."""
+        _release(self.data)
+        _release(self._grad)
+        self.data = self._grad = None
+
+    # ***** creation helpers *****
+    @classmethod
+    def zeros(cls, *shape, **kwargs) -> Tensor:
+        return cls(np.zeros(shape, dtype=np.float32), **kwargs)
+
+    @classmethod
+    def ones(cls, *shape, **kwargs) -> Tensor:
+        return cls(np.ones(shape, dtype=np.float32), **kwargs)
+
+    @classmethod
+    def empty(cls, *shape, **kwargs) -> Tensor:
+        return cls(np.empty(shape, dtype=np.float32), **kwargs)
+
+    @classmethod
+    def randn(cls, *shape, **kwargs) -> Tensor:
+        return cls(_RNG.standard_normal(size=shape, dtype=np.float32), **kwargs)
+
+    @classmethod
+    def arange(cls, stop, start=0, **kwargs) -> Tensor:
+        return cls(np.arange(start=start, stop=stop, dtype=np.float32), **kwargs)
+
+    @classmethod
+    def uniform(cls, *shape, **kwargs) -> Tensor:
+        return cls(_uniform_buf(shape, 1.0), **kwargs)
+
+    @classmethod
+    def scaled_uniform(cls, *shape, **kwargs) -> Tensor:
+        return cls(_uniform_buf(shape, math.prod(shape) ** -0.5), **kwargs)
+
+    @classmethod
+    def glorot_uniform(cls, *shape, **kwargs) -> Tensor:
+        scale = (6 / (shape[0] + math.prod(shape[1:]))) ** 0.5
+        return cls(_uniform_buf(shape, scale), **kwargs)
+
+    @classmethod
+    def eye(cls, dim: int, **kwargs) -> Tensor:
+        return cls(np.eye(dim, dtype=np.float32), **kwargs)
+
+    # operator classes are bound onto Tensor at the bottom of the module,
+    # so the dunders resolve them with one class-attribute load instead of
+    # a module lookup per call
+
+    # ***** math ops (unary) *****
+    def exp(self) -> Tensor: return Tensor.comm(Tensor._EXP, self)
+    def log(self) -> Tensor: return Tensor.comm(Tensor._LOG, self)
+    def reciprocal(self) -> Tensor: return Tensor.comm(Tensor._RECIPROCAL, self)
+    def abs(self) -> Tensor: return Tensor.comm(Tensor._ABS, self)
+
+    # ***** activation functions *****
+    def relu(self) -> Tensor: return Tensor.comm(Tensor._RELU, self)
+
+    # ***** reduction ops *****
+    def sum(self) -> Tensor: return Tensor.comm(Tensor._SUM, self)
+    def max(self) -> Tensor: return Tensor.comm(Tensor._MAX, self)
+    def min(self) -> Tensor: return Tensor.comm(Tensor._MIN, self)
+    def mean(self) -> Tensor: return Tensor.comm(Tensor._MEAN, self)
+
+    # ***** math ops (binary) *****
+    def __add__(self, x) -> Tensor: return Tensor.comm(Tensor._ADD, self, x)
+    def __radd__(self, x) -> Tensor: return Tensor.comm(Tensor._ADD, x, self)
+    def __sub__(self, x) -> Tensor: return Tensor.comm(Tensor._SUB, self, x)
+    def __rsub__(self, x) -> Tensor: return Tensor.comm(Tensor._SUB, x, self)
+    def __mul__(self, x) -> Tensor: return Tensor.comm(Tensor._MUL, self, x)
+    def __rmul__(self, x) -> Tensor: return Tensor.comm(Tensor._MUL, x, self)
+    def __pow__(self, x) -> Tensor: return Tensor.comm(Tensor._POW, self, x)
+    def __matmul__(self, x) -> Tensor: return Tensor.comm(Tensor._MATMUL, self, x)
+    def __truediv__(self, x) -> Tensor: return Tensor.comm(Tensor._DIV, self, x)
+    def __rtruediv__(self, x) -> Tensor: return Tensor.comm(Tensor._DIV, x, self)
+    def __neg__(self) -> Tensor:
+        # no gradient to route -> no Sub node, just negated data
+        if not self.requires_grad and self._ctx is None:
+            return Tensor(-self.data)
+        return Tensor.comm(Tensor._MUL, self, -1.0)
+
+    # ***** augmented assign ops *****
+    # exact type() checks: cheaper than isinstance and these run once per
+    # parameter per optimizer step
+    def __iadd__(self, x) -> Tensor:
+        self.data += x.data if type(x) is Tensor else x
+        return self
+
+    def __isub__(self, x) -> Tensor:
+        self.data -= x.data if type(x) is Tensor else x
+        return self
+
+    def __imul__(self, x) -> Tensor:
+        self.data *= x.data if type(x) is Tensor else x
+        return self
+
+    def __itruediv__(self, x) -> Tensor:
+        self.data /= x.data if type(x) is Tensor else x
+        return self
+
+    def update_(self, lr: float, grad=None) -> Tensor:
+        """In-place SGD-style step, data -= lr * grad, with no fresh allocations."""
+        g = self.grad if grad is None else (grad.data if type(grad) is Tensor else grad)
+        step = _rent(self.data.shape)
+        np.multiply(g, lr, out=step)
+        np.subtract(self.data, step, out=self.data)
+        _release(step)
+        return self
 
     def add(self, x): return self.__add__(x)
     def sub(self, x): return self.__sub__(x)
@@ -7,3 +344,22 @@
     def div(self, x): return self.__truediv__(x)
 
 
+import giagrad.mathops as mops
+import giagrad.reductionops as rops
+import giagrad.mlops as mlops
+
+Tensor._ADD = mops.Add
+Tensor._SUB = mops.Sub
+Tensor._MUL = mops.Mul
+Tensor._DIV = mops.Div
+Tensor._POW = mops.Pow
+Tensor._MATMUL = mops.Matmul
+Tensor._EXP = mops.Exp
+Tensor._LOG = mops.Log
+Tensor._RECIPROCAL = mops.Reciprocal
+Tensor._ABS = mops.Abs
+Tensor._RELU = mlops.ReLU
+Tensor._SUM = rops.Sum
+Tensor._MAX = rops.Max
+Tensor._MIN = rops.Min
+Tensor._MEAN = rops.Mean